@@ -14,17 +14,52 @@ Scope:
 - ML-related config belongs to ICE-AI or Runtime.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Any
-import yaml
+from typing import Any, Dict, Tuple
+import json
+
+# yaml is imported lazily: processes that never touch YAML config (or
+# that hit the JSON sidecar cache) skip its import cost entirely.
+_yaml_codec: Tuple[Any, Any, Any] | None = None
+
+
+def _yaml() -> Tuple[Any, Any, Any]:
+    """
+    Return (yaml module, loader, dumper), importing yaml on first use.
+
+    Prefers the libyaml-backed CSafeLoader/CSafeDumper when available
+    (same safety guarantees as SafeLoader/SafeDumper, several times
+    faster).
+    """
+    global _yaml_codec
+    if _yaml_codec is None:
+        import yaml
+
+        _yaml_codec = (
+            yaml,
+            getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+            getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        )
+    return _yaml_codec
+
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Create ``path`` if missing.
+
+    A single stat() when the directory already exists (the common case on
+    every config instantiation) instead of an unconditional mkdir syscall.
+    """
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
 
 
 # ======================================================================
 # DETECTION
 # ======================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DetectionConfig:
     """
     Detection configuration (patterns, heuristics, rules).
@@ -40,7 +75,7 @@ class DetectionConfig:
 # PARSING
 # ======================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ParsingConfig:
     """
     Parsing configuration.
@@ -56,7 +91,7 @@ class ParsingConfig:
 # GLOBAL CONFIG
 # ======================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DevToolsConfig:
     """
     Global DevTools configuration.
@@ -82,13 +117,13 @@ class DevToolsConfig:
         """
         Initialize derived paths and ensure directories exist.
         """
-        self.workspace_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.workspace_dir)
 
         self.cache_dir = self.workspace_dir / "cache"
         self.plugins_dir = self.workspace_dir / "plugins"
 
-        self.cache_dir.mkdir(exist_ok=True)
-        self.plugins_dir.mkdir(exist_ok=True)
+        _ensure_dir(self.cache_dir)
+        _ensure_dir(self.plugins_dir)
 
     # ------------------------------------------------------------------
     # LOADERS
@@ -99,36 +134,49 @@ class DevToolsConfig:
         if not path.exists():
             return cls()
 
+        # JSON sidecar cache: parsing JSON is an order of magnitude
+        # cheaper than YAML, so repeat startups skip the YAML parse
+        # entirely as long as the YAML has not been modified.
+        cache = path.with_suffix(path.suffix + ".cache.json")
+        try:
+            if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+                with cache.open("r", encoding="utf-8") as f:
+                    return cls.from_dict(json.load(f))
+        except (OSError, ValueError):
+            pass  # corrupted / unreadable cache: fall through and rebuild
+
+        yaml, loader, _ = _yaml()
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=loader) or {}
+
+        try:
+            with cache.open("w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except (OSError, TypeError):
+            pass  # cache is best-effort only
 
         return cls.from_dict(data)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> DevToolsConfig:
-        cfg = cls()
+        # Costruzione in un colpo solo: __post_init__ (path derivati +
+        # mkdir) gira una volta, non due come con cls() + mutazioni.
+        kwargs: Dict[str, Any] = {}
 
         if "detection" in data:
-            cfg.detection = DetectionConfig(**data["detection"])
+            kwargs["detection"] = DetectionConfig(**data["detection"])
 
         if "parsing" in data:
-            cfg.parsing = ParsingConfig(**data["parsing"])
+            kwargs["parsing"] = ParsingConfig(**data["parsing"])
 
         if "workspace_dir" in data:
-            cfg.workspace_dir = Path(data["workspace_dir"])
+            kwargs["workspace_dir"] = Path(data["workspace_dir"])
 
-        cfg.max_concurrent_tasks = data.get(
-            "max_concurrent_tasks",
-            cfg.max_concurrent_tasks,
-        )
-        cfg.enable_cache = data.get("enable_cache", cfg.enable_cache)
-        cfg.cache_ttl_seconds = data.get(
-            "cache_ttl_seconds",
-            cfg.cache_ttl_seconds,
-        )
+        for key in ("max_concurrent_tasks", "enable_cache", "cache_ttl_seconds"):
+            if key in data:
+                kwargs[key] = data[key]
 
-        cfg.__post_init__()
-        return cfg
+        return cls(**kwargs)
 
     # ------------------------------------------------------------------
     # SERIALIZATION
@@ -136,8 +184,8 @@ class DevToolsConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "detection": vars(self.detection),
-            "parsing": vars(self.parsing),
+            "detection": asdict(self.detection),
+            "parsing": asdict(self.parsing),
             "workspace_dir": str(self.workspace_dir),
             "max_concurrent_tasks": self.max_concurrent_tasks,
             "enable_cache": self.enable_cache,
@@ -145,9 +193,10 @@ class DevToolsConfig:
         }
 
     def save(self, path: Path) -> None:
+        yaml, _, dumper = _yaml()
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as f:
-            yaml.safe_dump(self.to_dict(), f, indent=2)
+            yaml.dump(self.to_dict(), f, Dumper=dumper, indent=2)
 
 
 # ----------------------------------------------------------------------
@@ -16,9 +16,36 @@ Scope:
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from ice_devtools.core.exceptions import ResourceError
+
+# pyarrow serve solo a to_record_batch(): import lazy al primo uso per
+# non pagare l'import pyarrow+numpy (~90 ms) a ogni import dei tipi
+# core.
+_pyarrow: Any = False  # False = non ancora risolto, None = assente
+
+
+def _arrow() -> Any:
+    global _pyarrow
+    if _pyarrow is False:
+        try:
+            import pyarrow as _pyarrow
+        except ImportError:  # pragma: no cover
+            _pyarrow = None
+    return _pyarrow
+
+
+def _utcnow() -> datetime:
+    """
+    TZ-aware UTC now.
+
+    datetime.utcnow() is deprecated (3.12) and returns naive datetimes;
+    datetime.now(timezone.utc) is also the faster C path.
+    """
+    return datetime.now(timezone.utc)
 
 
 # ======================================================================
@@ -38,11 +65,19 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# Lookup diretto stringa -> LogLevel (case canonico e lowercase): evita
+# costruttore Enum + try/except per ogni evento nei percorsi caldi.
+_LEVEL_LUT: Dict[str, LogLevel] = {
+    **{level.value: level for level in LogLevel},
+    **{level.value.lower(): level for level in LogLevel},
+}
+
+
 # ======================================================================
 # LOG SOURCE
 # ======================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LogSource:
     """
     Definition of a log source.
@@ -57,19 +92,19 @@ class LogSource:
     encoding: str = "utf-8"
     enabled: bool = True
 
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
 
     def touch(self) -> None:
         """Update modification timestamp."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _utcnow()
 
 
 # ======================================================================
 # LOG EVENT
 # ======================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LogEvent:
     """
     Parsed log event.
@@ -95,7 +130,7 @@ class LogEvent:
     # Time
     # ------------------------------------------------------------------
     timestamp: Optional[datetime] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
 
     # ------------------------------------------------------------------
     # Content
@@ -137,10 +172,10 @@ class LogEvent:
     def __post_init__(self) -> None:
         # Normalize log level if provided as string
         if isinstance(self.level, str):
-            try:
-                self.level = LogLevel(self.level.upper())
-            except ValueError:
-                self.level = None
+            self.level = (
+                _LEVEL_LUT.get(self.level)
+                or _LEVEL_LUT.get(self.level.upper())
+            )
 
     # ==================================================================
     # Helpers
@@ -193,16 +228,13 @@ class LogEvent:
 
         level = data.get("level")
         if isinstance(level, str):
-            try:
-                level = LogLevel(level.upper())
-            except ValueError:
-                level = None
+            level = _LEVEL_LUT.get(level) or _LEVEL_LUT.get(level.upper())
 
         return cls(
             event_id=data.get("event_id"),
             source_id=data.get("source_id"),
             timestamp=_parse_dt(data.get("timestamp")),
-            created_at=_parse_dt(data.get("created_at")) or datetime.utcnow(),
+            created_at=_parse_dt(data.get("created_at")) or _utcnow(),
             raw_message=data.get("raw_message"),
             parsed_message=data.get("parsed_message"),
             level=level,
@@ -217,3 +249,93 @@ class LogEvent:
             extracted_fields=data.get("extracted_fields", {}),
             structured_data=data.get("structured_data", {}),
         )
+
+
+# ======================================================================
+# LOG EVENT BATCH (SoA)
+# ======================================================================
+
+@dataclass(slots=True)
+class LogEventBatch:
+    """
+    Batch colonnare (structure-of-arrays) di LogEvent.
+
+    Ogni attributo è una colonna parallela: la riga i-esima di ogni lista
+    descrive lo stesso evento. Le scansioni downstream (filtri per level,
+    range temporali, export) operano per colonna invece che per oggetto,
+    e la serializzazione diventa un'unica conversione colonnare.
+    """
+
+    timestamps: List[Optional[datetime]] = field(default_factory=list)
+    levels: List[Optional[LogLevel]] = field(default_factory=list)
+    raw_messages: List[Optional[str]] = field(default_factory=list)
+    parsed_messages: List[Optional[str]] = field(default_factory=list)
+    event_types: List[Optional[str]] = field(default_factory=list)
+    confidences: List[float] = field(default_factory=list)
+    extracted_fields: List[Dict[str, Any]] = field(default_factory=list)
+    structured_data: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.raw_messages)
+
+    # ------------------------------------------------------------------
+
+    def append(self, event: LogEvent) -> None:
+        """Accoda un evento al batch."""
+        self.timestamps.append(event.timestamp)
+        self.levels.append(event.level)
+        self.raw_messages.append(event.raw_message)
+        self.parsed_messages.append(event.parsed_message)
+        self.event_types.append(event.event_type)
+        self.confidences.append(event.confidence)
+        self.extracted_fields.append(event.extracted_fields)
+        self.structured_data.append(event.structured_data)
+
+    @classmethod
+    def from_events(cls, events: List[LogEvent]) -> LogEventBatch:
+        """Converte una lista di LogEvent (AoS) in batch colonnare (SoA)."""
+        batch = cls()
+        for event in events:
+            batch.append(event)
+        return batch
+
+    def to_events(self) -> List[LogEvent]:
+        """Rimaterializza i LogEvent riga per riga."""
+        return [
+            LogEvent(
+                timestamp=self.timestamps[i],
+                level=self.levels[i],
+                raw_message=self.raw_messages[i],
+                parsed_message=self.parsed_messages[i],
+                event_type=self.event_types[i],
+                confidence=self.confidences[i],
+                extracted_fields=self.extracted_fields[i],
+                structured_data=self.structured_data[i],
+            )
+            for i in range(len(self))
+        ]
+
+    # ------------------------------------------------------------------
+
+    def to_pydict(self) -> Dict[str, list]:
+        """
+        Colonne in forma serializzabile (level come stringa, timestamp
+        come datetime). Compatibile con pyarrow.RecordBatch.from_pydict.
+        """
+        return {
+            "timestamp": self.timestamps,
+            "level": [lvl.value if lvl else None for lvl in self.levels],
+            "raw_message": self.raw_messages,
+            "parsed_message": self.parsed_messages,
+            "event_type": self.event_types,
+            "confidence": self.confidences,
+        }
+
+    def to_record_batch(self):
+        """
+        Converte in pyarrow.RecordBatch (richiede pyarrow).
+        """
+        pyarrow = _arrow()
+        if pyarrow is None:
+            raise ResourceError("pyarrow is required for to_record_batch()")
+        return pyarrow.RecordBatch.from_pydict(self.to_pydict())
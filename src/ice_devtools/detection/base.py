@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 import logging
 
-from ice_devtools.core.types import LogEvent
+from ice_devtools.core.types import LogEvent, LogEventBatch
 from ice_devtools.core.exceptions import DetectionError
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,20 @@ class BaseDetector(ABC):
         """Analizza una linea e restituisce LogEvent o None."""
         raise NotImplementedError
 
+    def detect_batch(self, lines: List[str]) -> LogEventBatch:
+        """
+        Analizza un blocco di linee e restituisce un batch colonnare.
+
+        L'implementazione di default itera detect(); i detector con un
+        percorso vettorizzato possono fare override.
+        """
+        batch = LogEventBatch()
+        for line in lines:
+            event = self.detect(line)
+            if event is not None:
+                batch.append(event)
+        return batch
+
     def flush(self) -> Optional[LogEvent]:
         """Hook per multiline detector."""
         return None
@@ -10,18 +10,28 @@ Responsabilità:
 
 from __future__ import annotations
 
+import functools
 import re
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, Dict, Any
 import logging
 
-try:
-    from dateutil.parser import parse as date_parse
-except ImportError:  # pragma: no cover
-    date_parse = None
-
 logger = logging.getLogger(__name__)
 
+# dateutil serve solo al fallback fuzzy: import lazy al primo uso per
+# non pagarne il costo quando tutti i timestamp matchano i pattern.
+_date_parse: Any = False  # False = non ancora risolto, None = assente
+
+
+def _fuzzy_parser() -> Any:
+    global _date_parse
+    if _date_parse is False:
+        try:
+            from dateutil.parser import parse as _date_parse
+        except ImportError:  # pragma: no cover
+            _date_parse = None
+    return _date_parse
+
 
 class DateParser:
     """
@@ -35,58 +45,52 @@ class DateParser:
     - Fallback fuzzy (dateutil)
     """
 
+    #: Upper bound on memoized results: keeps frequent formats hot while
+    #: capping memory on long-running ingestion of mostly-unique lines.
+    CACHE_SIZE = 8192
+
     def __init__(self) -> None:
-        self._patterns = self._compile_patterns()
-        self._cache: Dict[str, Tuple[Optional[datetime], str, float]] = {}
+        self._parse_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._parse_uncached
+        )
 
     # ------------------------------------------------------------------ #
     # PATTERN SETUP
     # ------------------------------------------------------------------ #
 
-    def _compile_patterns(self) -> list[tuple[re.Pattern, str, float]]:
-        return [
-            # ISO 8601
-            (
-                re.compile(
-                    r'(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}'
-                    r'(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)'
-                ),
-                "iso8601",
-                0.95,
-            ),
-            # Syslog: "Mon DD HH:MM:SS"
-            (
-                re.compile(r'([A-Z][a-z]{2}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})'),
-                "syslog",
-                0.85,
-            ),
-            # Apache / Nginx
-            (
-                re.compile(
-                    r'(\d{2}/[A-Z][a-z]{2}/\d{4}:\d{2}:\d{2}:\d{2}\s+[+-]\d{4})'
-                ),
-                "apache",
-                0.85,
-            ),
-            # Simple datetime
-            (
-                re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'),
-                "simple",
-                0.75,
-            ),
-            # Unix timestamp (seconds)
-            (
-                re.compile(r'\b(\d{10})\b'),
-                "unix_seconds",
-                0.7,
-            ),
-            # Unix timestamp (milliseconds)
-            (
-                re.compile(r'\b(\d{13})\b'),
-                "unix_millis",
-                0.7,
-            ),
-        ]
+    #: (format name, pattern source, confidence) — l'ordine definisce la
+    #: priorità tra alternative che iniziano alla stessa posizione.
+    _PATTERN_SPECS: list[tuple[str, str, float]] = [
+        # ISO 8601
+        (
+            "iso8601",
+            r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}'
+            r'(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?',
+            0.95,
+        ),
+        # Syslog: "Mon DD HH:MM:SS"
+        ("syslog", r'[A-Z][a-z]{2}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}', 0.85),
+        # Apache / Nginx
+        (
+            "apache",
+            r'\d{2}/[A-Z][a-z]{2}/\d{4}:\d{2}:\d{2}:\d{2}\s+[+-]\d{4}',
+            0.85,
+        ),
+        # Simple datetime
+        ("simple", r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', 0.75),
+        # Unix timestamp (seconds)
+        ("unix_seconds", r'\b\d{10}\b', 0.7),
+        # Unix timestamp (milliseconds)
+        ("unix_millis", r'\b\d{13}\b', 0.7),
+    ]
+
+    # Compilati una sola volta a livello di classe: istanze multiple di
+    # DateParser (e fixture di test) condividono lo stesso oggetto regex.
+    # L'alternation a gruppi nominati scansiona il testo in un solo passo.
+    _MASTER = re.compile(
+        "|".join(f"(?P<{name}>{src})" for name, src, _ in _PATTERN_SPECS)
+    )
+    _CONFIDENCE = {name: conf for name, _, conf in _PATTERN_SPECS}
 
     # ------------------------------------------------------------------ #
     # PUBLIC API
@@ -101,62 +105,87 @@ class DateParser:
         """
         Estrae timestamp da testo.
 
+        `context` non influenza il matching: la cache è keyed sul solo testo.
+
         Returns:
             (datetime | None, format_name, confidence)
         """
-        cache_key = f"{text}|{context}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        for pattern, fmt, confidence in self._patterns:
-            match = pattern.search(text)
-            if not match:
-                continue
+        return self._parse_cached(text)
 
-            raw = match.group(1)
+    def _parse_uncached(self, text: str) -> Tuple[Optional[datetime], str, float]:
+        for match in self._MASTER.finditer(text):
+            fmt = match.lastgroup
             try:
-                dt = self._parse_specific(raw, fmt)
+                dt = self._parse_specific(match.group(fmt), fmt)
                 if dt:
-                    result = (dt, fmt, confidence)
-                    self._cache[cache_key] = result
-                    return result
+                    return (dt, fmt, self._CONFIDENCE[fmt])
             except Exception:
                 continue
 
         # Fallback fuzzy parsing
+        date_parse = _fuzzy_parser()
         if date_parse:
             try:
                 dt = date_parse(text, fuzzy=True)
-                result = (dt, "fuzzy", 0.4)
-                self._cache[cache_key] = result
-                return result
+                return (dt, "fuzzy", 0.4)
             except Exception:
                 pass
 
-        result = (None, "unknown", 0.0)
-        self._cache[cache_key] = result
-        return result
+        return (None, "unknown", 0.0)
 
     # ------------------------------------------------------------------ #
     # INTERNALS
     # ------------------------------------------------------------------ #
 
+    _MONTHS = {
+        "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+        "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+    }
+
     def _parse_specific(self, value: str, fmt: str) -> Optional[datetime]:
+        # La regex ha già validato la forma: i campi si estraggono per
+        # slicing diretto, ~5-10x più veloce di strptime per chiamata.
         if fmt == "iso8601":
+            # Fast path per la forma fissa a 19 char "YYYY-MM-DD?HH:MM:SS"
+            # (di gran lunga la più comune): slicing diretto, ~2x rispetto
+            # a fromisoformat e senza stringhe intermedie.
+            if len(value) == 19:
+                return datetime(
+                    int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                    int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                )
             normalized = value.replace(" ", "T")
             if normalized.endswith("Z"):
                 normalized = normalized.replace("Z", "+00:00")
             return datetime.fromisoformat(normalized)
 
         if fmt == "syslog":
-            year = datetime.now().year
-            return datetime.strptime(f"{year} {value}", "%Y %b %d %H:%M:%S")
+            # "Mon DD HH:MM:SS" (giorno a larghezza variabile)
+            mon, day, hms = value.split()
+            return datetime(
+                datetime.now().year, self._MONTHS[mon], int(day),
+                int(hms[0:2]), int(hms[3:5]), int(hms[6:8]),
+            )
 
         if fmt == "apache":
-            return datetime.strptime(value, "%d/%b/%Y:%H:%M:%S %z")
+            # "DD/Mon/YYYY:HH:MM:SS +ZZZZ"
+            offset = value[20:].lstrip()
+            delta = timedelta(
+                hours=int(offset[1:3]), minutes=int(offset[3:5])
+            )
+            if offset[0] == "-":
+                delta = -delta
+            return datetime(
+                int(value[7:11]), self._MONTHS[value[3:6]], int(value[0:2]),
+                int(value[12:14]), int(value[15:17]), int(value[18:20]),
+                tzinfo=timezone(delta),
+            )
 
         if fmt == "simple":
-            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            )
 
         if fmt == "unix_seconds":
             return datetime.fromtimestamp(int(value), tz=timezone.utc)
@@ -167,7 +196,7 @@ class DateParser:
         return None
 
     def clear_cache(self) -> None:
-        self._cache.clear()
+        self._parse_cached.cache_clear()
 
 
 # Singleton opzionale
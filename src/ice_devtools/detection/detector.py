@@ -1,15 +1,50 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Optional
 import logging
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 from ice_devtools.core.types import LogEvent, LogLevel
 from ice_devtools.detection.base import BaseDetector
 from ice_devtools.detection.patterns import PATTERNS
 
 logger = logging.getLogger(__name__)
 
+# Alternation unica su tutti i pattern: una sola scansione della linea
+# invece di un .search() per pattern.
+_COMBINED = re.compile(
+    "|".join(f"(?P<{name}>{p.regex.pattern})" for name, p in PATTERNS.items())
+)
+
+# Hyperscan (DFA vettorizzato) come prefiltro opzionale: una scansione
+# nativa individua QUALI pattern colpiscono, poi solo quelli vengono
+# rieseguiti con `re` per estrarre il testo (hyperscan non espone i
+# gruppi di cattura). Fallback trasparente su _COMBINED.
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover
+    hyperscan = None
+
+_HS_NAMES = tuple(PATTERNS)
+_HS_DB = None
+if hyperscan is not None:  # pragma: no cover - optional native path
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[p.regex.pattern.encode() for p in PATTERNS.values()],
+            ids=list(range(len(PATTERNS))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(PATTERNS),
+        )
+    except Exception:
+        logger.debug("Hyperscan database build failed, using re", exc_info=True)
+        _HS_DB = None
+
 
 class UniversalDetector(BaseDetector):
     """
@@ -29,12 +64,7 @@ class UniversalDetector(BaseDetector):
             self._stats["matched"] += 1
             return event
 
-        extracted = {}
-
-        for p in PATTERNS.values():
-            m = p.regex.search(line)
-            if m:
-                extracted[p.name] = m.group(0)
+        extracted = self._scan_patterns(line)
 
         if extracted:
             self._stats["matched"] += 1
@@ -49,9 +79,43 @@ class UniversalDetector(BaseDetector):
         self._stats["failed"] += 1
         return None
 
+    def _scan_patterns(self, line: str) -> Optional[dict]:
+        # Il dict viene materializzato solo al primo match: le linee che
+        # non colpiscono alcun pattern (il caso comune sui fallimenti)
+        # non pagano nessuna allocazione.
+        extracted: Optional[dict] = None
+
+        if _HS_DB is None:
+            for m in _COMBINED.finditer(line):
+                if extracted is None:
+                    extracted = {}
+                extracted.setdefault(m.lastgroup, m.group())
+            return extracted
+
+        hit_ids: set[int] = set()  # pragma: no cover - optional native path
+        _HS_DB.scan(
+            line.encode("utf-8", "replace"),
+            match_event_handler=lambda pid, start, end, flags, ctx: hit_ids.add(pid),
+        )
+
+        for pid in hit_ids:
+            name = _HS_NAMES[pid]
+            m = PATTERNS[name].regex.search(line)
+            if m:
+                if extracted is None:
+                    extracted = {}
+                extracted[name] = m.group(0)
+        return extracted
+
     def _detect_json(self, line: str) -> Optional[LogEvent]:
+        # Solo gli oggetti JSON interessano: il check sul primo carattere
+        # evita di pagare json.loads (ed eccezione) su ogni linea non-JSON.
+        stripped = line.lstrip()
+        if not stripped or stripped[0] != "{":
+            return None
+
         try:
-            data = json.loads(line)
+            data = _json_loads(stripped)
         except Exception:
             return None
 
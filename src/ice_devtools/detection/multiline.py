@@ -22,22 +22,17 @@ class MultilineBuffer:
     NON crea LogEvent.
     """
 
+    # Alternation unica: una sola chiamata re.match per linea invece di
+    # un loop Python su più pattern nel percorso caldo dell'ingestione.
+    _START_RE = re.compile(
+        r'Traceback \(most recent call last\):|Exception in thread ".+"'
+    )
+
     def __init__(self, enabled: bool = True) -> None:
         self.enabled = enabled
         self._buffer: List[str] = []
         self._started_at: Optional[datetime] = None
 
-        self._start_patterns = [
-            re.compile(r'^Traceback \(most recent call last\):'),
-            re.compile(r'^Exception in thread ".+"'),
-        ]
-
-        self._continue_patterns = [
-            re.compile(r'^\s+'),
-            re.compile(r'^\s+at '),
-            re.compile(r'^\s+File "'),
-        ]
-
     # ------------------------------------------------------------------ #
     # PUBLIC API
     # ------------------------------------------------------------------ #
@@ -45,10 +40,12 @@ class MultilineBuffer:
     def should_start(self, line: str) -> bool:
         if not self.enabled:
             return False
-        return any(p.match(line) for p in self._start_patterns)
+        return self._START_RE.match(line) is not None
 
     def should_continue(self, line: str) -> bool:
-        return any(p.match(line) for p in self._continue_patterns)
+        # Le continuation ("  at ...", '  File "...') iniziano tutte con
+        # whitespace: basta un test sul primo carattere, niente regex.
+        return line[:1] in (" ", "\t")
 
     def push(self, line: str) -> None:
         if not self._buffer:
@@ -2,11 +2,25 @@
 
 import csv
 import json
-import html
 from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Stessa escape-map di html.escape(quote=True), ma via str.translate:
+# un'unica passata C sulla stringa invece di cinque str.replace.
+_HTML_TRANS = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
 
 class TableExporter:
     """
@@ -37,6 +51,9 @@ class TableExporter:
             self._txt(path)
 
     def _json(self, path: Path) -> None:
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.rows, option=orjson.OPT_INDENT_2))
+            return
         with path.open("w", encoding="utf-8") as f:
             json.dump(self.rows, f, indent=2, ensure_ascii=False)
 
@@ -52,54 +69,55 @@ class TableExporter:
     def _html(self, path: Path) -> None:
         if not self.rows:
             return
-        keys = self.rows[0].keys()
+        keys = tuple(self.rows[0])
 
-        rows_html = "\n".join(
-            "<tr>" + "".join(f"<td>{html.escape(str(row.get(k,'')))}</td>" for k in keys) + "</tr>"
-            for row in self.rows
-        )
-
-        html_doc = f"""<!doctype html>
-<html>
-<head>
-<meta charset="utf-8">
-<title>Export {datetime.now().isoformat()}</title>
-<style>
-table {{ border-collapse: collapse; }}
-th, td {{ border: 1px solid #444; padding: 6px; }}
-</style>
-</head>
-<body>
-<table>
-<thead>
-<tr>{"".join(f"<th>{html.escape(str(k))}</th>" for k in keys)}</tr>
-</thead>
-<tbody>
-{rows_html}
-</tbody>
-</table>
-</body>
-</html>
-"""
-        path.write_text(html_doc, encoding="utf-8")
+        # Scrittura incrementale: mai l'intero documento in memoria.
+        with path.open("w", encoding="utf-8") as f:
+            f.write(
+                "<!doctype html>\n<html>\n<head>\n"
+                '<meta charset="utf-8">\n'
+                f"<title>Export {datetime.now().isoformat()}</title>\n"
+                "<style>\n"
+                "table { border-collapse: collapse; }\n"
+                "th, td { border: 1px solid #444; padding: 6px; }\n"
+                "</style>\n</head>\n<body>\n<table>\n<thead>\n"
+            )
+            f.write(
+                "<tr>"
+                + "".join(
+                    f"<th>{str(k).translate(_HTML_TRANS)}</th>" for k in keys
+                )
+                + "</tr>\n"
+            )
+            f.write("</thead>\n<tbody>\n")
+            for row in self.rows:
+                f.write(
+                    "<tr>"
+                    + "".join(
+                        f"<td>{str(row.get(k, '')).translate(_HTML_TRANS)}</td>"
+                        for k in keys
+                    )
+                    + "</tr>\n"
+                )
+            f.write("</tbody>\n</table>\n</body>\n</html>\n")
 
     def _markdown(self, path: Path) -> None:
         if not self.rows:
             return
         keys = list(self.rows[0].keys())
-        lines = [
-            "| " + " | ".join(keys) + " |",
-            "| " + " | ".join(["---"] * len(keys)) + " |",
-        ]
-        for row in self.rows:
-            lines.append("| " + " | ".join(str(row.get(k, "")) for k in keys) + " |")
-        path.write_text("\n".join(lines), encoding="utf-8")
+        with path.open("w", encoding="utf-8") as f:
+            f.write("| " + " | ".join(keys) + " |\n")
+            f.write("| " + " | ".join(["---"] * len(keys)) + " |\n")
+            for row in self.rows:
+                f.write(
+                    "| " + " | ".join(str(row.get(k, "")) for k in keys) + " |\n"
+                )
 
     def _txt(self, path: Path) -> None:
         if not self.rows:
             return
         keys = list(self.rows[0].keys())
-        lines = ["\t".join(keys)]
-        for row in self.rows:
-            lines.append("\t".join(str(row.get(k, "")) for k in keys))
-        path.write_text("\n".join(lines), encoding="utf-8")
+        with path.open("w", encoding="utf-8") as f:
+            f.write("\t".join(keys) + "\n")
+            for row in self.rows:
+                f.write("\t".join(str(row.get(k, "")) for k in keys) + "\n")
@@ -1,10 +1,12 @@
 # ice_devtools/generation/generate_cv.py
 
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.colors import HexColor
 from reportlab.platypus import (
     SimpleDocTemplate,
@@ -13,7 +15,7 @@ from reportlab.platypus import (
     ListFlowable,
     ListItem,
     HRFlowable,
-    KeepTogether,
+    KeepInFrame,
 )
 
 # ============================================================================
@@ -25,6 +27,79 @@ ACCENT = HexColor("#E6CFE3")
 TEXT = HexColor("#2C2C2C")
 MUTED = HexColor("#6E6E6E")
 
+# Costruiti una sola volta a modulo: ReportLab ricostruiva l'intero
+# stylesheet a ogni CVGenerator(), un costo inutile nei job batch che
+# generano molti CV nello stesso processo.
+_BASE_STYLES: Dict[str, ParagraphStyle] = {
+    "name": ParagraphStyle(
+        name="name",
+        fontSize=22,
+        textColor=PRIMARY,
+        spaceAfter=2,
+        leading=26,
+        fontName="Helvetica-Bold"
+    ),
+    "title": ParagraphStyle(
+        name="title",
+        fontSize=12,
+        textColor=MUTED,
+        spaceAfter=6
+    ),
+    "meta": ParagraphStyle(
+        name="meta",
+        fontSize=9,
+        textColor=MUTED,
+        spaceAfter=12
+    ),
+    "section": ParagraphStyle(
+        name="section",
+        fontSize=14,
+        textColor=PRIMARY,
+        spaceBefore=18,
+        spaceAfter=6
+    ),
+    "body": ParagraphStyle(
+        name="body",
+        fontSize=10.5,
+        textColor=TEXT,
+        leading=14
+    ),
+    "role": ParagraphStyle(
+        name="role",
+        fontSize=11.5,
+        fontName="Helvetica-Bold",
+        spaceAfter=2
+    ),
+    "company": ParagraphStyle(
+        name="company",
+        fontSize=10,
+        textColor=MUTED,
+        spaceAfter=2
+    ),
+    "location": ParagraphStyle(
+        name="location",
+        fontSize=9.5,
+        textColor=MUTED,
+        spaceAfter=4
+    ),
+    "bullet": ParagraphStyle(
+        name="bullet",
+        fontSize=10,
+        leading=13
+    ),
+    "edu": ParagraphStyle(
+        name="edu",
+        fontSize=11,
+        spaceAfter=2
+    ),
+}
+
+# Prefissi di markup costanti: hoistati a modulo per non ricostruirli
+# (e re-internarli) a ogni sezione generata.
+_SKILLS_CORE_PREFIX = "<b>Professionali:</b> "
+_SKILLS_SOFT_PREFIX = "<b>Trasversali:</b> "
+_EXTRA_FMT = "<b>{0}:</b> {1}".format
+
 # ============================================================================
 # CV GENERATOR
 # ============================================================================
@@ -72,6 +147,21 @@ class CVGenerator:
 
         doc.build(story)
 
+    def build_pdf_async(self, output_path: str | Path) -> Future:
+        """
+        Variante non bloccante di build_pdf: il rendering (CPU-bound,
+        GIL-bound) viene sottomesso al process pool di modulo e il
+        chiamante riceve una Future. N CV si costruiscono in parallelo
+        e i caller web/API non restano bloccati sul rendering.
+
+        Viene picklato solo self.data: il worker ricostruisce il
+        generatore nel processo figlio, dove gli stili di modulo sono
+        già caldi dopo il primo task.
+        """
+        return _pdf_pool().submit(
+            _build_pdf_worker, self.data, str(output_path)
+        )
+
     # ---------------------------------------------------------------------
     # SECTIONS
     # ---------------------------------------------------------------------
@@ -82,13 +172,15 @@ class CVGenerator:
         story.append(Paragraph(profile.get("full_name", ""), self.styles["name"]))
         story.append(Paragraph(profile.get("title", ""), self.styles["title"]))
 
-        meta = " • ".join(
-            filter(None, [
+        meta = " • ".join([
+            part
+            for part in (
                 profile.get("location"),
                 profile.get("phone"),
                 profile.get("email"),
-            ])
-        )
+            )
+            if part
+        ])
         if meta:
             story.append(Paragraph(meta, self.styles["meta"]))
 
@@ -118,7 +210,7 @@ class CVGenerator:
             period = self._format_period(exp.get("start"), exp.get("end"))
 
             block.append(Paragraph(role, self.styles["role"]))
-            block.append(Paragraph(f"{company} · {period}", self.styles["company"]))
+            block.append(Paragraph(" · ".join((company, period)), self.styles["company"]))
 
             if exp.get("location"):
                 block.append(Paragraph(exp["location"], self.styles["location"]))
@@ -131,7 +223,10 @@ class CVGenerator:
                 ]
                 block.append(ListFlowable(items, leftIndent=14))
 
-            story.append(KeepTogether(block))
+            # KeepInFrame localizza il layout al singolo blocco:
+            # KeepTogether rientra nella passata quadratica di wrapping
+            # globale quando i blocchi sono tanti.
+            story.append(KeepInFrame(0, 0, block, mode="shrink", hAlign="LEFT"))
             story.append(Spacer(1, 12))
 
     def _section_education(self, story: list) -> None:
@@ -146,14 +241,15 @@ class CVGenerator:
             school = edu.get("school", "")
             year = edu.get("year", "")
 
-            story.append(Paragraph(
+            block = [Paragraph(
                 f"{title} – {school} ({year})",
                 self.styles["edu"]
-            ))
+            )]
 
             if edu.get("location"):
-                story.append(Paragraph(edu["location"], self.styles["location"]))
+                block.append(Paragraph(edu["location"], self.styles["location"]))
 
+            story.append(KeepInFrame(0, 0, block, mode="shrink", hAlign="LEFT"))
             story.append(Spacer(1, 6))
 
     def _section_skills(self, story: list) -> None:
@@ -165,13 +261,13 @@ class CVGenerator:
 
         if skills.get("core"):
             story.append(Paragraph(
-                "<b>Professionali:</b> " + ", ".join(skills["core"]),
+                _SKILLS_CORE_PREFIX + ", ".join(skills["core"]),
                 self.styles["body"]
             ))
 
         if skills.get("soft"):
             story.append(Paragraph(
-                "<b>Trasversali:</b> " + ", ".join(skills["soft"]),
+                _SKILLS_SOFT_PREFIX + ", ".join(skills["soft"]),
                 self.styles["body"]
             ))
 
@@ -201,7 +297,7 @@ class CVGenerator:
 
         for key, value in extra.items():
             story.append(Paragraph(
-                f"<b>{key.capitalize()}:</b> {value}",
+                _EXTRA_FMT(key.capitalize(), value),
                 self.styles["body"]
             ))
 
@@ -224,77 +320,30 @@ class CVGenerator:
         return text.rstrip(".;, ")
 
     def _build_styles(self) -> dict:
-        styles = getSampleStyleSheet()
-
-        styles.add(ParagraphStyle(
-            name="name",
-            fontSize=22,
-            textColor=PRIMARY,
-            spaceAfter=2,
-            leading=26,
-            fontName="Helvetica-Bold"
-        ))
-
-        styles.add(ParagraphStyle(
-            name="title",
-            fontSize=12,
-            textColor=MUTED,
-            spaceAfter=6
-        ))
-
-        styles.add(ParagraphStyle(
-            name="meta",
-            fontSize=9,
-            textColor=MUTED,
-            spaceAfter=12
-        ))
-
-        styles.add(ParagraphStyle(
-            name="section",
-            fontSize=14,
-            textColor=PRIMARY,
-            spaceBefore=18,
-            spaceAfter=6
-        ))
-
-        styles.add(ParagraphStyle(
-            name="body",
-            fontSize=10.5,
-            textColor=TEXT,
-            leading=14
-        ))
-
-        styles.add(ParagraphStyle(
-            name="role",
-            fontSize=11.5,
-            fontName="Helvetica-Bold",
-            spaceAfter=2
-        ))
-
-        styles.add(ParagraphStyle(
-            name="company",
-            fontSize=10,
-            textColor=MUTED,
-            spaceAfter=2
-        ))
-
-        styles.add(ParagraphStyle(
-            name="location",
-            fontSize=9.5,
-            textColor=MUTED,
-            spaceAfter=4
-        ))
-
-        styles.add(ParagraphStyle(
-            name="bullet",
-            fontSize=10,
-            leading=13
-        ))
-
-        styles.add(ParagraphStyle(
-            name="edu",
-            fontSize=11,
-            spaceAfter=2
-        ))
-
-        return styles
+        # Copia shallow del dict condiviso: gli stili sono di fatto
+        # read-only, ma un override per-istanza resta possibile senza
+        # toccare i default di modulo.
+        return dict(_BASE_STYLES)
+
+
+# ============================================================================
+# ASYNC BUILD (PROCESS POOL)
+# ============================================================================
+
+# Pool lazy: si paga lo spawn dei worker solo se build_pdf_async viene
+# davvero usata; ogni worker importa ReportLab (e _BASE_STYLES) una
+# volta per processo, non per task.
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _pdf_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+def _build_pdf_worker(data: Dict[str, Any], output_path: str) -> str:
+    """Worker picklabile: ricostruisce il generatore nel figlio."""
+    CVGenerator(data).build_pdf(output_path)
+    return output_path
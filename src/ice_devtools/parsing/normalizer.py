@@ -14,21 +14,26 @@ Responsabilità:
 - ML
 """
 
+import functools
 import re
 import logging
+import sys
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ice_devtools.core.types import LogEvent, LogLevel
-from ice_devtools.core.exceptions import ParseError
+from ice_devtools.core.exceptions import ParsingError
 
 logger = logging.getLogger(__name__)
 
-
-class LogNormalizer:
-    """Normalizer puro, senza detection."""
-
-    _LEVEL_MAP = {
+# A modulo (LOAD_GLOBAL invece della catena self->classe) perché usata
+# per evento tramite _resolve_level. Il set è chiuso: chiavi internate
+# (sys.intern), così il lookup sui token canonici si risolve per
+# identità prima ancora del confronto byte a byte; le varianti
+# maiuscole sono precalcolate per evitare il .lower() sul caso comune.
+_LEVEL_MAP = {
+    sys.intern(key): value
+    for key, value in {
         "debug": LogLevel.DEBUG,
         "info": LogLevel.INFO,
         "warn": LogLevel.WARNING,
@@ -36,21 +41,111 @@ class LogNormalizer:
         "error": LogLevel.ERROR,
         "fatal": LogLevel.CRITICAL,
         "critical": LogLevel.CRITICAL,
-    }
+        "DEBUG": LogLevel.DEBUG,
+        "INFO": LogLevel.INFO,
+        "WARN": LogLevel.WARNING,
+        "WARNING": LogLevel.WARNING,
+        "ERROR": LogLevel.ERROR,
+        "FATAL": LogLevel.CRITICAL,
+        "CRITICAL": LogLevel.CRITICAL,
+    }.items()
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_level(raw: str) -> Optional[LogLevel]:
+    """
+    Stringa level -> LogLevel, memoizzata.
+
+    Gli stessi pochi token ("INFO", "ERROR", ...) si ripetono milioni di
+    volte: il primo .get() copre le forme canoniche senza allocare la
+    copia lowercase; il fallback .lower() resta per i casi misti
+    ("Error", "WaRn"), e la cache ammortizza comunque entrambi.
+    """
+    return _LEVEL_MAP.get(raw) or _LEVEL_MAP.get(raw.lower())
+
+
+# Pulizia messaggi:
+# 1. sequenze ANSI via regex, solo se '\x1b' è presente (test C a costo
+#    quasi nullo) — DEVE precedere la translate, perché \x1b è a sua
+#    volta un control char e rimuoverlo prima lascerebbe "[31m" orfani;
+# 2. control char via str.translate (passata interamente C);
+# 3. collasso whitespace via regex.
+_ANSI_SRC = r"\x1b\[[0-9;]*m"
+_WS_SRC = r"\s+"
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)], None)
+
+# Timestamp "YYYY-MM-DD[ T]HH:MM:SS[.ffff[Z]]": un match + int() diretti
+# al posto del loop di strptime, che ricostruisce regex e tabelle locale
+# a ogni chiamata.
+_TS_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:\.(\d+)Z?)?$"
+)
+
+
+# Engine opzionale: google-re2 scansiona con un DFA (niente backtracking)
+# a throughput molto più alto del modulo re. I pattern non usano feature
+# fuori dal subset RE2, ma un sanity check a import protegge da
+# differenze di semantica; in caso di dubbio si resta su re.
+_ANSI_RE = re.compile(_ANSI_SRC)
+_WS_RE = re.compile(_WS_SRC)
+
+# JIT opzionale: per record con molti campi numerici lo scan digit-only
+# gira in codice macchina numba su un buffer contiguo, invece del
+# try/int per campo. Il costo di compilazione si paga una volta per
+# processo (cache=True lo persiste su disco).
+try:  # pragma: no cover - optional native path
+    import numba as _numba
+    import numpy as _np
+
+    @_numba.njit(cache=True)
+    def _scan_ints(buf, offsets):
+        n = offsets.shape[0] - 1
+        ok = _np.zeros(n, dtype=_np.bool_)
+        vals = _np.zeros(n, dtype=_np.int64)
+        for i in range(n):
+            value = 0
+            good = offsets[i] < offsets[i + 1]
+            for j in range(offsets[i], offsets[i + 1]):
+                c = buf[j]
+                if c < 48 or c > 57:
+                    good = False
+                    break
+                value = value * 10 + (c - 48)
+            if good:
+                ok[i] = True
+                vals[i] = value
+        return ok, vals
+
+except ImportError:
+    _scan_ints = None
+    _np = None
+try:  # pragma: no cover - optional native engine
+    import re2 as _re2
+
+    _ansi, _ws = _re2.compile(_ANSI_SRC), _re2.compile(_WS_SRC)
+    if (
+        _ansi.sub("", "\x1b[31ma\x1b[0m") == "a"
+        and _ws.sub(" ", "a \t b") == "a b"
+    ):
+        _ANSI_RE, _WS_RE = _ansi, _ws
+except Exception:
+    pass
+
+
+class LogNormalizer:
+    """Normalizer puro, senza detection."""
 
-    _CLEANUP_PATTERNS = [
-        (re.compile(r"\x1b\[[0-9;]*m"), ""),     # ANSI
-        (re.compile(r"[\x00-\x1f\x7f-\x9f]"), ""),  # control chars
-        (re.compile(r"\s+"), " "),
-    ]
+    # Contatori come int puri: "self._x += 1" è un attribute store,
+    # niente hash+lookup del dict a ogni evento. Il dict si ricostruisce
+    # solo in get_stats().
+    __slots__ = ("_normalized", "_levels", "_timestamps", "_messages")
 
     def __init__(self) -> None:
-        self.stats = {
-            "normalized": 0,
-            "levels": 0,
-            "timestamps": 0,
-            "messages": 0,
-        }
+        self._normalized = 0
+        self._levels = 0
+        self._timestamps = 0
+        self._messages = 0
 
     # ------------------------------------------------------------------
 
@@ -61,11 +156,11 @@ class LogNormalizer:
             self._clean_message(event)
             self._coerce_fields(event)
 
-            self.stats["normalized"] += 1
+            self._normalized += 1
             return event
 
         except Exception as exc:
-            raise ParseError(f"Normalization failed: {exc}") from exc
+            raise ParsingError(f"Normalization failed: {exc}") from exc
 
     # ------------------------------------------------------------------
 
@@ -79,10 +174,10 @@ class LogNormalizer:
         )
 
         if isinstance(raw, str):
-            level = self._LEVEL_MAP.get(raw.lower())
+            level = _resolve_level(raw)
             if level:
                 event.level = level
-                self.stats["levels"] += 1
+                self._levels += 1
 
     # ------------------------------------------------------------------
 
@@ -96,26 +191,32 @@ class LogNormalizer:
 
         if isinstance(raw, datetime):
             event.timestamp = raw
-            self.stats["timestamps"] += 1
+            self._timestamps += 1
             return
 
         if isinstance(raw, (int, float)):
             event.timestamp = datetime.fromtimestamp(raw)
-            self.stats["timestamps"] += 1
+            self._timestamps += 1
             return
 
         if isinstance(raw, str):
-            for fmt in (
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            ):
-                try:
-                    event.timestamp = datetime.strptime(raw, fmt)
-                    self.stats["timestamps"] += 1
-                    return
-                except ValueError:
-                    continue
+            m = _TS_RE.match(raw)
+            if m:
+                y, mo, d, h, mi, s, frac = m.groups()
+                event.timestamp = datetime(
+                    int(y), int(mo), int(d), int(h), int(mi), int(s),
+                    int(frac[:6].ljust(6, "0")) if frac else 0,
+                )
+                self._timestamps += 1
+                return
+
+            # Varianti ISO non coperte (offset, ecc.): fromisoformat è
+            # implementato in C ed è comunque ~10x più veloce di strptime.
+            try:
+                event.timestamp = datetime.fromisoformat(raw)
+                self._timestamps += 1
+            except ValueError:
+                pass
 
     # ------------------------------------------------------------------
 
@@ -124,29 +225,94 @@ class LogNormalizer:
             return
 
         msg = event.raw_message
-        for pattern, repl in self._CLEANUP_PATTERNS:
-            msg = pattern.sub(repl, msg)
-
-        msg = msg.strip()
+        if "\x1b" in msg:
+            msg = _ANSI_RE.sub("", msg)
+        msg = _WS_RE.sub(" ", msg.translate(_CTRL_TABLE)).strip()
 
         if msg != event.raw_message:
             event.parsed_message = msg
-            self.stats["messages"] += 1
+            self._messages += 1
         elif not event.parsed_message:
             event.parsed_message = event.raw_message
 
     # ------------------------------------------------------------------
 
+    #: Sotto questa soglia il packing buffer+offset costa più del
+    #: try/int per campo: si resta sul percorso Python.
+    _JIT_MIN_FIELDS = 8
+
     def _coerce_fields(self, event: LogEvent) -> None:
-        for k, v in list(event.extracted_fields.items()):
-            if isinstance(v, str) and v.isdigit():
-                event.extracted_fields[k] = int(v)
+        fields = event.extracted_fields
+        if _scan_ints is not None and len(fields) >= self._JIT_MIN_FIELDS:
+            self._coerce_fields_jit(fields)
+            return
+
+        # Niente isdigit(): scansionerebbe tutta la stringa prima di una
+        # seconda scansione in int(). Un test sul primo carattere filtra i
+        # non-numerici, int() valida il resto. Si riassegna solo su chiavi
+        # esistenti, quindi niente copia difensiva di items().
+        for k, v in fields.items():
+            if type(v) is str and v and "0" <= v[0] <= "9":
+                try:
+                    fields[k] = int(v)
+                except ValueError:
+                    pass
+
+    @staticmethod
+    def _coerce_fields_jit(fields: Dict[str, Any]) -> None:
+        # I candidati (stringhe che iniziano con cifra, entro int64)
+        # vengono impacchettati in un unico buffer con offset e scansati
+        # dalla funzione jitted; i rari rigetti (es. "12x7") ripassano
+        # dal try/int così la semantica resta identica al percorso puro.
+        keys = []
+        parts = []
+        offsets = [0]
+        total = 0
+        oversized = []
+        for k, v in fields.items():
+            if type(v) is str and v and "0" <= v[0] <= "9":
+                if len(v) > 18:
+                    # Oltre int64: niente jit, ma la coercion resta
+                    # dovuta (int() di Python è unbounded).
+                    oversized.append(k)
+                    continue
+                raw = v.encode("utf-8")
+                keys.append(k)
+                parts.append(raw)
+                total += len(raw)
+                offsets.append(total)
+
+        for k in oversized:
+            try:
+                fields[k] = int(fields[k])
+            except ValueError:
+                pass
+        if not keys:
+            return
+
+        buf = _np.frombuffer(b"".join(parts), dtype=_np.uint8)
+        ok, vals = _scan_ints(buf, _np.asarray(offsets, dtype=_np.int64))
+        for i, k in enumerate(keys):
+            if ok[i]:
+                fields[k] = int(vals[i])
+            else:
+                try:
+                    fields[k] = int(fields[k])
+                except ValueError:
+                    pass
 
     # ------------------------------------------------------------------
 
     def get_stats(self) -> Dict[str, int]:
-        return dict(self.stats)
+        return {
+            "normalized": self._normalized,
+            "levels": self._levels,
+            "timestamps": self._timestamps,
+            "messages": self._messages,
+        }
 
     def reset_stats(self) -> None:
-        for k in self.stats:
-            self.stats[k] = 0
+        self._normalized = 0
+        self._levels = 0
+        self._timestamps = 0
+        self._messages = 0
@@ -11,65 +11,267 @@ Reader → LogEvent → Normalizer → output
 ⚠️ NO orchestrator
 """
 
+import time
 from pathlib import Path
-from typing import Iterator, Union
+from typing import Any, Iterator, List, Optional, Union
 import logging
 from datetime import datetime
 
-from ice_devtools.parsing.reader import LogReader
-from ice_devtools.parsing.normalizer import LogNormalizer
-from ice_devtools.core.types import LogEvent
-from ice_devtools.core.exceptions import ParseError
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - optional columnar path
+    pa = None
+    pc = None
+
+from ice_devtools.parsing.reader import LogReader, RawLogRecord
+from ice_devtools.parsing.normalizer import LogNormalizer, _LEVEL_MAP
+from ice_devtools.core.types import LogEvent, LogEventBatch
+from ice_devtools.core.exceptions import ParsingError, ResourceError
 
 logger = logging.getLogger(__name__)
 
+# Pulizia colonnare: ANSI + control char in un'unica alternation (la
+# branch ANSI precede la classe control, così "\x1b[31m" cade intera).
+_ARROW_STRIP_SRC = r"\x1b\[[0-9;]*m|[\x00-\x1f\x7f-\x9f]"
+_ARROW_WS_SRC = r"\s+"
+
 
 class LogProcessor:
     """Processor base per parsing offline."""
 
+    # Contatori come int puri (niente hash+store di dict nel percorso
+    # caldo) e clock monotonico a ns per la durata: il dict delle stats
+    # si ricostruisce solo in get_stats().
+    __slots__ = ("normalizer", "_events", "_normalized", "_failed",
+                 "_started_ns")
+
     def __init__(self, normalizer: LogNormalizer | None = None):
         self.normalizer = normalizer or LogNormalizer()
-        self.stats = {
-            "events": 0,
-            "normalized": 0,
-            "failed": 0,
-            "started_at": None,
-        }
+        self._events = 0
+        self._normalized = 0
+        self._failed = 0
+        self._started_ns = 0
 
     # ------------------------------------------------------------------
 
-    def process_file(self, path: Union[str, Path]) -> Iterator[LogEvent]:
-        reader = LogReader(path)
-        self.stats["started_at"] = datetime.utcnow()
+    def process_file(
+        self, path: Union[str, Path], *, typed: bool = False
+    ) -> Iterator[LogEvent]:
+        """
+        Stream piatto di eventi; wrapper su process_file_batches.
+
+        Con typed=True (richiede msgspec) i record JSONL arrivano come
+        RawLogRecord tipizzati: niente dict intermedio, ma i campi fuori
+        schema vengono scartati.
+        """
+        for events in self.process_file_batches(path, typed=typed):
+            yield from events
+
+    def process_file_batches(
+        self,
+        path: Union[str, Path],
+        batch: int = 1024,
+        *,
+        typed: bool = False,
+    ) -> Iterator[List[LogEvent]]:
+        """
+        Come process_file, ma yielda liste di eventi di dimensione
+        `batch`: il confine del generatore (e il bookkeeping delle
+        stats, aggiornato una volta per batch invece che per evento)
+        viene attraversato batch volte di meno.
+        """
+        reader = LogReader(path, typed=typed)
+        self._started_ns = time.perf_counter_ns()
+
+        events: List[LogEvent] = []
+        failed = 0
 
         for record in reader.read():
             try:
-                event = LogEvent(
-                    raw_message=str(record),
-                    structured_data=record if isinstance(record, dict) else {},
+                events.append(
+                    self.normalizer.normalize(self._build_event(record))
                 )
+            except Exception as exc:
+                failed += 1
+                logger.debug("Failed event", exc_info=exc)
+                continue
 
-                event = self.normalizer.normalize(event)
+            if len(events) >= batch:
+                self._events += len(events) + failed
+                self._normalized += len(events)
+                self._failed += failed
+                failed = 0
+                yield events
+                events = []
 
-                self.stats["events"] += 1
-                self.stats["normalized"] += 1
+        if events or failed:
+            self._events += len(events) + failed
+            self._normalized += len(events)
+            self._failed += failed
+            if events:
+                yield events
 
-                yield event
+    # ------------------------------------------------------------------
+    # COLUMNAR PATH (pyarrow)
+    # ------------------------------------------------------------------
 
-            except Exception as exc:
-                self.stats["events"] += 1
-                self.stats["failed"] += 1
-                logger.debug("Failed event", exc_info=exc)
+    def process_file_batched(
+        self, path: Union[str, Path], batch_size: int = 100_000
+    ) -> Iterator[LogEventBatch]:
+        """
+        Percorso colonnare (richiede pyarrow).
+
+        I record vengono accumulati in colonne parallele e la
+        normalizzazione (pulizia messaggi, level, timestamp) gira nei
+        kernel di pyarrow.compute: l'overhead Python per-record viene
+        ammortizzato sull'intero batch invece di essere pagato riga per
+        riga come in process_file. I timestamp fuori dal formato ISO
+        restano None e possono passare dal normalizer per-evento.
+        """
+        if pc is None:
+            raise ResourceError(
+                "pyarrow is required for process_file_batched()"
+            )
+
+        reader = LogReader(path)
+        self._started_ns = time.perf_counter_ns()
+
+        messages: List[str] = []
+        levels: List[Optional[str]] = []
+        timestamps: List[Any] = []
+
+        for record in reader.read():
+            if isinstance(record, dict):
+                messages.append(str(record.get("message") or record))
+                levels.append(
+                    record.get("level") or record.get("severity")
+                )
+                timestamps.append(record.get("timestamp"))
+            else:
+                messages.append(str(record))
+                levels.append(None)
+                timestamps.append(None)
+
+            if len(messages) >= batch_size:
+                yield self._normalize_columns(messages, levels, timestamps)
+                messages, levels, timestamps = [], [], []
+
+        if messages:
+            yield self._normalize_columns(messages, levels, timestamps)
+
+    def _normalize_columns(
+        self,
+        messages: List[str],
+        levels: List[Optional[str]],
+        timestamps: List[Any],
+    ) -> LogEventBatch:
+        n = len(messages)
+
+        # Messaggi: strip ANSI/control + collasso whitespace, tutto in C.
+        cleaned = pc.replace_substring_regex(
+            pa.array(messages, type=pa.string()),
+            pattern=_ARROW_STRIP_SRC,
+            replacement="",
+        )
+        cleaned = pc.replace_substring_regex(
+            cleaned, pattern=_ARROW_WS_SRC, replacement=" "
+        )
+        parsed_messages = pc.utf8_trim_whitespace(cleaned).to_pylist()
+
+        # Level: dictionary-encode e lookup sui soli valori unici del
+        # dizionario, non sulle n righe.
+        encoded = pc.dictionary_encode(
+            pc.utf8_lower(
+                pa.array(
+                    [v if isinstance(v, str) else None for v in levels],
+                    type=pa.string(),
+                )
+            )
+        )
+        lut = [_LEVEL_MAP.get(v) for v in encoded.dictionary.to_pylist()]
+        resolved_levels = [
+            lut[i] if i is not None else None
+            for i in encoded.indices.to_pylist()
+        ]
+
+        # Timestamp: strptime vettoriale sul formato ISO dominante; le
+        # righe che non matchano (o già datetime) si risolvono dopo.
+        parsed_ts = pc.strptime(
+            pa.array(
+                [v if isinstance(v, str) else None for v in timestamps],
+                type=pa.string(),
+            ),
+            format="%Y-%m-%dT%H:%M:%S",
+            unit="us",
+            error_is_null=True,
+        ).to_pylist()
+        resolved_ts = [
+            ts if ts is not None
+            else (raw if isinstance(raw, datetime) else None)
+            for ts, raw in zip(parsed_ts, timestamps, strict=False)
+        ]
+
+        self._events += n
+        self._normalized += n
+
+        return LogEventBatch(
+            timestamps=resolved_ts,
+            levels=resolved_levels,
+            raw_messages=messages,
+            parsed_messages=parsed_messages,
+            event_types=[None] * n,
+            confidences=[0.0] * n,
+            extracted_fields=[{} for _ in range(n)],
+            structured_data=[{} for _ in range(n)],
+        )
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _build_event(record) -> LogEvent:
+        if isinstance(record, dict):
+            return LogEvent(
+                raw_message=str(record),
+                structured_data=record,
+            )
+
+        if RawLogRecord is not None and isinstance(record, RawLogRecord):
+            # Accesso per attributo, niente .get(): i campi noti finiscono
+            # in extracted_fields dove il normalizer li consuma.
+            extracted = {}
+            if record.timestamp is not None:
+                extracted["timestamp"] = record.timestamp
+            if record.level is not None:
+                extracted["level"] = record.level
+            return LogEvent(
+                raw_message=record.message,
+                logger_name=record.logger,
+                extracted_fields=extracted,
+            )
+
+        return LogEvent(raw_message=str(record))
 
     # ------------------------------------------------------------------
 
     def get_stats(self) -> dict:
+        elapsed_ns = (
+            time.perf_counter_ns() - self._started_ns
+            if self._started_ns else 0
+        )
         return {
-            "processor": dict(self.stats),
+            "processor": {
+                "events": self._events,
+                "normalized": self._normalized,
+                "failed": self._failed,
+                "elapsed_ns": elapsed_ns,
+            },
             "normalizer": self.normalizer.get_stats(),
         }
 
     def reset_stats(self) -> None:
-        for k in self.stats:
-            self.stats[k] = 0
+        self._events = 0
+        self._normalized = 0
+        self._failed = 0
+        self._started_ns = 0
         self.normalizer.reset_stats()
@@ -18,15 +18,62 @@ Responsabilità:
 import csv
 import json
 import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Iterator, Dict, Any, Union
+from typing import Iterator, Dict, Any, Optional, Tuple, Union
 
-from ice_devtools.core.exceptions import ParseError
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None
+
+try:
+    import charset_normalizer
+except ImportError:  # pragma: no cover
+    charset_normalizer = None
+
+from ice_devtools.core.exceptions import ParsingError
 
 logger = logging.getLogger(__name__)
 
 
+# =====================================================================
+# TYPED RECORD (opzionale, msgspec)
+# =====================================================================
+
+if msgspec is not None:  # pragma: no cover - optional fast path
+
+    class RawLogRecord(msgspec.Struct, frozen=True):
+        """
+        Record JSONL tipizzato: msgspec decodifica il JSON direttamente
+        in questa struct, senza dict intermedio né materializzazione dei
+        campi sconosciuti (che vengono ignorati).
+        """
+
+        timestamp: Any = None
+        level: Any = None
+        message: Any = None
+        logger: Any = None
+
+    _TYPED_DECODER = msgspec.json.Decoder(RawLogRecord)
+else:
+    RawLogRecord = None
+    _TYPED_DECODER = None
+
+
 # =====================================================================
 # FORMAT ENUM
 # =====================================================================
@@ -39,6 +86,63 @@ class LogFormat(str, Enum):
     UNKNOWN = "unknown"
 
 
+# =====================================================================
+# PARALLEL WORKER
+# =====================================================================
+
+def _read_chunk(
+    path: str,
+    start: int,
+    end: int,
+    fmt: "LogFormat",
+    encoding: str,
+    typed: bool,
+) -> Tuple[list, Dict[str, int]]:
+    """
+    Worker di read_parallel: legge il byte-range [start, end) — già
+    allineato ai newline dal chiamante — e lo parsa con la stessa
+    semantica di _read_text/_read_jsonl. A livello di modulo perché
+    ProcessPoolExecutor deve poterlo picklare.
+    """
+    stats = {"records_read": 0, "records_skipped": 0, "decode_errors": 0}
+    records: list = []
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    if fmt == LogFormat.TEXT:
+        for line in data.decode(encoding, "replace").splitlines():
+            text = line.rstrip()
+            if not text:
+                stats["records_skipped"] += 1
+                continue
+            stats["records_read"] += 1
+            records.append(text)
+    else:  # JSONL
+        decode = (
+            _TYPED_DECODER.decode
+            if typed and _TYPED_DECODER is not None
+            else _json_loads
+        )
+        # splitlines() come nel ramo TEXT: split(b"\n") produrrebbe un
+        # elemento vuoto in coda per chunk (ogni range finisce su un
+        # newline), gonfiando records_skipped di un'unità per worker.
+        for raw in data.splitlines():
+            raw = raw.strip()
+            if not raw:
+                stats["records_skipped"] += 1
+                continue
+            try:
+                records.append(decode(raw))
+                stats["records_read"] += 1
+            except ValueError:
+                stats["decode_errors"] += 1
+                stats["records_skipped"] += 1
+
+    return records, stats
+
+
 # =====================================================================
 # READER
 # =====================================================================
@@ -48,10 +152,23 @@ class LogReader:
     Reader universale per file di log.
     """
 
-    def __init__(self, path: Union[str, Path]) -> None:
+    # Niente __dict__ per istanza: accesso attributi più rapido nei loop
+    # di lettura e footprint minore quando si processano migliaia di
+    # file. format/encoding restano calcolati eagerly in __init__
+    # (cached_property richiederebbe proprio il __dict__).
+    __slots__ = ("path", "typed", "format", "encoding", "stats")
+
+    def __init__(self, path: Union[str, Path], *, typed: bool = False) -> None:
         self.path = Path(path)
         if not self.path.exists():
-            raise ParseError(f"File not found: {self.path}")
+            raise ParsingError(f"File not found: {self.path}")
+
+        # typed=True: i record JSONL vengono decodificati in RawLogRecord
+        # (richiede msgspec; i campi sconosciuti vengono scartati).
+        if typed and _TYPED_DECODER is None:
+            logger.warning("typed=True requires msgspec, falling back to dict")
+            typed = False
+        self.typed = typed
 
         self.format = self._detect_format()
         self.encoding = self._detect_encoding()
@@ -81,22 +198,50 @@ class LogReader:
             ".jsonl": LogFormat.JSONL,
         }.get(ext, LogFormat.UNKNOWN)
 
-    def _detect_encoding(self) -> str:
-        candidates = ("utf-8", "latin-1", "cp1252", "iso-8859-1")
+    #: Cache path -> encoding a livello di classe: riaprire lo stesso
+    #: file (pipeline multi-pass, read_parallel) non ri-sniffa.
+    _ENCODING_CACHE: Dict[str, str] = {}
 
-        for enc in candidates:
-            try:
-                with self.path.open("r", encoding=enc) as f:
-                    f.read(1024)
-                return enc
-            except UnicodeDecodeError:
-                continue
+    def _detect_encoding(self) -> str:
+        # Una sola lettura binaria di 4 KiB invece di un open per
+        # candidato: prima si tenta UTF-8 (il caso dominante, e un
+        # errore di decode è definitivo), poi si sniffa con
+        # charset-normalizer; latin-1 mappa ogni byte e non può fallire.
+        key = str(self.path)
+        cached = self._ENCODING_CACHE.get(key)
+        if cached:
+            return cached
+
+        with self.path.open("rb") as f:
+            head = f.read(4096)
 
-        logger.warning(
-            "Encoding detection failed, using utf-8 with replacement",
-            extra={"path": str(self.path)},
-        )
-        return "utf-8"
+        try:
+            head.decode("utf-8")
+            enc = "utf-8"
+        except UnicodeDecodeError as exc:
+            if len(head) == 4096 and exc.start >= len(head) - 3:
+                # Il read binario può tagliare un carattere multibyte al
+                # byte 4096: se il read ha davvero toccato il cap e
+                # fallisce solo la coda troncata (un carattere UTF-8
+                # occupa al più 4 byte), il prefisso è UTF-8 valido e
+                # l'errore non è diagnostico. Su file più corti nulla è
+                # troncato e l'errore va preso sul serio.
+                enc = "utf-8"
+            else:
+                enc = ""
+                if charset_normalizer is not None:
+                    best = charset_normalizer.from_bytes(head).best()
+                    if best is not None:
+                        enc = best.encoding
+                if not enc:
+                    logger.warning(
+                        "Encoding sniff inconclusive, using latin-1",
+                        extra={"path": str(self.path)},
+                    )
+                    enc = "latin-1"
+
+        self._ENCODING_CACHE[key] = enc
+        return enc
 
     # -----------------------------------------------------------------
     # PUBLIC API
@@ -118,16 +263,129 @@ class LogReader:
         elif self.format == LogFormat.JSONL:
             yield from self._read_jsonl()
         else:
-            raise ParseError(f"Unsupported file format: {self.path.suffix}")
+            raise ParsingError(f"Unsupported file format: {self.path.suffix}")
+
+    #: Sotto questa soglia il costo di spawn/pickle supera il guadagno:
+    #: si resta sul percorso seriale.
+    _PARALLEL_MIN_SIZE = 16 * 1024 * 1024
+
+    def read_parallel(
+        self, workers: Optional[int] = None
+    ) -> Iterator[Union[str, Dict[str, Any]]]:
+        """
+        Variante parallela di read() per TEXT/JSONL: il file viene
+        spezzato in byte-range allineati ai newline e i range vengono
+        parsati in processi worker. L'ordine dei record è preservato
+        (i risultati si consumano nell'ordine di sottomissione) e le
+        stats per-worker vengono sommate in self.stats.
+
+        Per file piccoli (<16 MiB), formati non line-oriented (CSV ha
+        l'header, JSON è un documento unico) o workers<=1 si delega al
+        percorso seriale.
+        """
+        if self.format not in (LogFormat.TEXT, LogFormat.JSONL):
+            yield from self.read()
+            return
+
+        size = self.path.stat().st_size
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if size < self._PARALLEL_MIN_SIZE or workers <= 1:
+            yield from self.read()
+            return
+
+        # Confini: seek al punto nominale, poi readline() per agganciarsi
+        # all'inizio della riga successiva.
+        bounds = [0]
+        step = size // workers
+        with open(self.path, "rb") as f:
+            for i in range(1, workers):
+                f.seek(i * step)
+                f.readline()
+                pos = f.tell()
+                if pos >= size:
+                    break
+                if pos > bounds[-1]:
+                    bounds.append(pos)
+        bounds.append(size)
+
+        try:
+            with ProcessPoolExecutor(max_workers=len(bounds) - 1) as pool:
+                futures = [
+                    pool.submit(
+                        _read_chunk,
+                        str(self.path), start, end,
+                        self.format, self.encoding, self.typed,
+                    )
+                    for start, end in zip(
+                        bounds[:-1], bounds[1:], strict=False
+                    )
+                ]
+                for future in futures:
+                    records, stats = future.result()
+                    for key, value in stats.items():
+                        self.stats[key] += value
+                    yield from records
+
+        except Exception as exc:
+            raise ParsingError(
+                f"Failed to read file in parallel: {self.path}"
+            ) from exc
 
     # -----------------------------------------------------------------
     # TEXT
     # -----------------------------------------------------------------
 
+    #: Buffer di lettura: 1 MiB riduce di molto le syscall sui file grandi.
+    _BUFFER_SIZE = 1 << 20
+
+    #: Sopra questa soglia (e con numpy disponibile) il line-splitting
+    #: passa da mmap + scan vettoriale dei newline.
+    _MMAP_MIN_SIZE = 64 * 1024 * 1024
+
+    def _use_mmap(self) -> bool:
+        return (
+            _np is not None
+            and self.path.stat().st_size > self._MMAP_MIN_SIZE
+        )
+
+    def _iter_lines_mmap(self) -> Iterator[bytes]:
+        """
+        Linee (bytes, senza newline) via mmap: gli offset dei newline si
+        trovano con un'unica passata vettoriale numpy invece del loop
+        per-riga di Python, poi le linee si affettano dalla mappa.
+        """
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                buf = _np.frombuffer(mm, dtype=_np.uint8)
+                size = buf.size
+                newlines = _np.flatnonzero(buf == 0x0A).tolist()
+                # La view numpy va rilasciata prima di mm.close(),
+                # altrimenti l'uscita dal with solleva BufferError.
+                del buf
+
+                start = 0
+                for end in newlines:
+                    yield mm[start:end]
+                    start = end + 1
+                if start < size:
+                    yield mm[start:size]
+
     def _read_text(self) -> Iterator[str]:
         try:
-            with self.path.open(
-                "r", encoding=self.encoding, errors="replace"
+            if self._use_mmap():
+                for raw in self._iter_lines_mmap():
+                    text = raw.decode(self.encoding, "replace").rstrip()
+                    if not text:
+                        self.stats["records_skipped"] += 1
+                        continue
+                    self.stats["records_read"] += 1
+                    yield text
+                return
+
+            with open(
+                self.path, "r", encoding=self.encoding, errors="replace",
+                buffering=self._BUFFER_SIZE,
             ) as f:
                 for line_no, line in enumerate(f, 1):
                     text = line.rstrip()
@@ -139,7 +397,7 @@ class LogReader:
                     yield text
 
         except Exception as exc:
-            raise ParseError(
+            raise ParsingError(
                 f"Failed to read text file: {self.path}"
             ) from exc
 
@@ -149,8 +407,9 @@ class LogReader:
 
     def _read_csv(self) -> Iterator[Dict[str, Any]]:
         try:
-            with self.path.open(
-                "r", encoding=self.encoding, newline="", errors="replace"
+            with open(
+                self.path, "r", encoding=self.encoding, newline="",
+                errors="replace", buffering=self._BUFFER_SIZE,
             ) as f:
                 reader = csv.DictReader(f)
                 for row in reader:
@@ -158,7 +417,7 @@ class LogReader:
                     yield dict(row)
 
         except Exception as exc:
-            raise ParseError(
+            raise ParsingError(
                 f"Failed to read CSV file: {self.path}"
             ) from exc
 
@@ -168,10 +427,9 @@ class LogReader:
 
     def _read_json(self) -> Iterator[Dict[str, Any]]:
         try:
-            with self.path.open(
-                "r", encoding=self.encoding, errors="replace"
-            ) as f:
-                data = json.load(f)
+            # Lettura binaria: la decodifica UTF-8 la fa il parser JSON,
+            # senza il layer str intermedio di Python.
+            data = _json_loads(self.path.read_bytes())
 
             if isinstance(data, list):
                 for item in data:
@@ -181,7 +439,8 @@ class LogReader:
                 self.stats["records_read"] += 1
                 yield data
 
-        except json.JSONDecodeError:
+        except ValueError:
+            # Copre json.JSONDecodeError e orjson.JSONDecodeError
             logger.info(
                 "JSON decode failed, falling back to JSONL",
                 extra={"path": str(self.path)},
@@ -189,7 +448,7 @@ class LogReader:
             yield from self._read_jsonl()
 
         except Exception as exc:
-            raise ParseError(
+            raise ParsingError(
                 f"Failed to read JSON file: {self.path}"
             ) from exc
 
@@ -199,9 +458,35 @@ class LogReader:
 
     def _read_jsonl(self) -> Iterator[Dict[str, Any]]:
         try:
-            with self.path.open(
-                "r", encoding=self.encoding, errors="replace"
-            ) as f:
+            # Binario: niente decodifica incrementale né newline
+            # translation in Python; il parser JSON consuma i bytes UTF-8
+            # direttamente.
+            decode = (
+                _TYPED_DECODER.decode
+                if self.typed and _TYPED_DECODER is not None
+                else _json_loads
+            )
+            if self._use_mmap():
+                for line_no, line in enumerate(self._iter_lines_mmap(), 1):
+                    raw = line.strip()
+                    if not raw:
+                        self.stats["records_skipped"] += 1
+                        continue
+
+                    try:
+                        data = decode(raw)
+                        self.stats["records_read"] += 1
+                        yield data
+                    except ValueError:
+                        self.stats["decode_errors"] += 1
+                        self.stats["records_skipped"] += 1
+                        logger.debug(
+                            "JSONL parse error",
+                            extra={"line": line_no, "path": str(self.path)},
+                        )
+                return
+
+            with open(self.path, "rb", buffering=self._BUFFER_SIZE) as f:
                 for line_no, line in enumerate(f, 1):
                     raw = line.strip()
                     if not raw:
@@ -209,10 +494,10 @@ class LogReader:
                         continue
 
                     try:
-                        data = json.loads(raw)
+                        data = decode(raw)
                         self.stats["records_read"] += 1
                         yield data
-                    except json.JSONDecodeError:
+                    except ValueError:
                         self.stats["decode_errors"] += 1
                         self.stats["records_skipped"] += 1
                         logger.debug(
@@ -221,7 +506,7 @@ class LogReader:
                         )
 
         except Exception as exc:
-            raise ParseError(
+            raise ParsingError(
                 f"Failed to read JSONL file: {self.path}"
             ) from exc
 